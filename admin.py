@@ -5,19 +5,45 @@ import asyncio
 import argparse
 import getpass
 import json
+import os
+import hashlib
 import time
 import random
+import signal
+import stat
 import textwrap
 import httpx
-from typing import Optional
+from collections import defaultdict
+from typing import Awaitable, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
+try:
+    import h2  # noqa: F401  # httpx's http2=True raises ImportError without it
+except ImportError:  # optional, HTTP/1.1 is the fallback
+    h2 = None
 
 class C:
     HEADER = '\033[95m'; BLUE = '\033[94m'; CYAN = '\033[96m'
     GREEN = '\033[92m'; YELLOW = '\033[93m'; RED = '\033[91m'
     END = '\033[0m'; BOLD = '\033[1m'
 
+# piped/redirected output (e.g. audit logs) gets plain text
+_TTY = sys.stdout.isatty()
+if not _TTY:
+    for _name in ("HEADER", "BLUE", "CYAN", "GREEN", "YELLOW", "RED", "END", "BOLD"):
+        setattr(C, _name, "")
+
+# built once: TextWrapper compiles its splitting regexes on construction
+_WRAPPER = textwrap.TextWrapper(width=78)
+
 def color(s: str, col: str = C.END) -> str:
-    return f"{col}{s}{C.END}"
+    if not _TTY:
+        return s
+    return col + s + C.END
 
 def prin(s: str, col: str = C.END) -> None:
     print(color(s, col))
@@ -30,50 +56,141 @@ def confirm(prompt: str) -> bool:
         return False
     return r in ("y", "yes")
 
+def read_until_dot() -> str:
+    """Read stdin lines up to a lone '.' (or EOF) and return them joined."""
+    buf = []
+    try:
+        for line in iter(sys.stdin.readline, ""):
+            if line.rstrip("\n") == ".":
+                break
+            buf.append(line)
+    except KeyboardInterrupt:
+        print()
+    return "".join(buf)
+
+def loads_json(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def pretty_json(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+def _token_cache_dir() -> str:
+    # runtime dir is per-user 0700 tmpfs on most Linux systems; never the shared temp dir
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        base = os.path.join(runtime, "omx")
+    else:
+        base = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "omx")
+    os.makedirs(base, mode=0o700, exist_ok=True)
+    if hasattr(os, "getuid"):
+        st = os.lstat(base)
+        if st.st_uid != os.getuid() or not stat.S_ISDIR(st.st_mode):
+            raise OSError(f"{base} is not a directory owned by this user")
+        if st.st_mode & 0o077:
+            os.chmod(base, 0o700)
+    return base
+
+def _token_cache_path(server: str, username: str) -> str:
+    key = hashlib.sha256(f"{server}|{username.lower()}".encode()).hexdigest()[:16]
+    return os.path.join(_token_cache_dir(), f"admin-{key}.json")
+
+def _read_private_file(path: str) -> str:
+    """Read path only if it is a regular file owned by this user and not readable by others."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    with os.fdopen(fd, "r") as f:
+        st = os.fstat(f.fileno())
+        if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o077
+                                      or not stat.S_ISREG(st.st_mode)):
+            raise OSError(f"refusing {path}: not a private file of this user")
+        return f.read()
+
+def _write_private_file(path: str, data: str) -> None:
+    # fresh O_EXCL temp file (never an existing or planted one), then an atomic rename
+    tmp = f"{path}.{os.getpid()}.{random.getrandbits(32):08x}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_NOFOLLOW", 0), 0o600)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+class APIResponse(dict):
+    """Decoded JSON object that also keeps the raw response body for display."""
+    raw: bytes = b""
+
 class APIError(Exception):
-    def __init__(self, detail):
+    def __init__(self, detail, status: int | None = None, recoverable: bool = False, retry_after: float = 0.0):
         super().__init__(str(detail))
         self.detail = detail
+        self.status = status
+        self.recoverable = recoverable
+        self.retry_after = retry_after
 
 class HTTPXAdminClient:
-    def __init__(self, base_url: str, timeout: int = 8, retries: int = 3, backoff: float = 0.4):
+    def __init__(self, base_url: str, timeout: int = 8, retries: int = 3, backoff: float = 0.4, max_delay: float = 30.0):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.retries = max(1, int(retries))
         self.backoff = float(backoff)
+        self.max_delay = float(max_delay)
         self.token: Optional[str] = None
         self.username: Optional[str] = None
         self._client: Optional[httpx.AsyncClient] = None
-
-    def _url(self, path: str) -> str:
-        return self.base_url + path
+        self._auth_headers: dict[str, str] = {}
 
     async def _client_ctx(self):
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                # HTTP/2 is negotiated via TLS ALPN, so it only applies to https:// servers
+                http2=h2 is not None and self.base_url.startswith("https://"),
+                timeout=self.timeout,
+                headers=self._auth_headers,
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            )
         return self._client
 
     async def _request(self, path: str, method: str = "POST", json_payload: dict | None = None, params: dict | None = None):
         async def do_once():
             client = await self._client_ctx()
-            headers = {}
-            if self.token:
-                headers["Authorization"] = f"Bearer {self.token}"
             try:
                 if method.upper() == "POST":
-                    r = await client.post(self._url(path), json=json_payload or {}, headers=headers)
+                    r = await client.post(path, json=json_payload or {})
                 else:
-                    r = await client.get(self._url(path), params=params or {}, headers=headers)
+                    r = await client.get(path, params=params or {})
             except httpx.RequestError as e:
-                raise APIError(f"request error: {e}") from e
+                raise APIError(f"request error: {e}", recoverable=True) from e
+            # 408/429/5xx are transient; any other 4xx won't change on retry
+            recoverable = r.status_code in (408, 429) or r.status_code >= 500
+            retry_after = 0.0
+            if r.status_code in (429, 503):
+                try:
+                    retry_after = float(r.headers.get("Retry-After", 0))
+                except ValueError:
+                    # HTTP-date form is not worth parsing here; fall back to backoff
+                    retry_after = 0.0
             try:
-                data = r.json()
+                data = loads_json(r.content)
             except Exception:
-                raise APIError(f"invalid json from server (status {r.status_code})")
+                raise APIError(f"invalid json from server (status {r.status_code})",
+                               status=r.status_code, recoverable=recoverable, retry_after=retry_after)
             if r.status_code >= 400:
-                raise APIError({"status": r.status_code, "body": data})
+                raise APIError({"status": r.status_code, "body": data},
+                               status=r.status_code, recoverable=recoverable, retry_after=retry_after)
             if isinstance(data, dict) and data.get("ok") is False:
                 raise APIError(data)
+            if isinstance(data, dict):
+                data = APIResponse(data)
+                data.raw = r.content
             return data
 
         last_exc = None
@@ -82,9 +199,10 @@ class HTTPXAdminClient:
                 return await do_once()
             except APIError as e:
                 last_exc = e
-                if attempt + 1 >= self.retries:
+                if not e.recoverable or attempt + 1 >= self.retries:
                     raise
-                await asyncio.sleep(self.backoff * (2 ** attempt) + random.random() * 0.1)
+                delay = min(self.max_delay, max(e.retry_after, self.backoff * (2 ** attempt)))
+                await asyncio.sleep(delay + random.random() * 0.1)
         raise last_exc
 
     async def close(self):
@@ -92,6 +210,14 @@ class HTTPXAdminClient:
             await self._client.aclose()
             self._client = None
 
+    async def _set_token(self, username: str, token: Optional[str]):
+        self.token = token
+        self.username = username.lower() if token else None
+        self._auth_headers = {"Authorization": f"Bearer {token}"} if token else {}
+        client = await self._client_ctx()
+        client.headers.pop("Authorization", None)
+        client.headers.update(self._auth_headers)
+
     async def login(self, username: str, password: str):
         payload = {"username": username, "password": password}
         resp = await self._request("/login", "POST", json_payload=payload)
@@ -99,9 +225,47 @@ class HTTPXAdminClient:
         role = resp.get("role")
         if not token:
             raise APIError("no token returned by server")
-        self.token = token
-        self.username = username.lower()
-        return {"token": token, "role": role, "expires": resp.get("expires")}
+        await self._set_token(username, token)
+        info = {"token": token, "role": role, "expires": resp.get("expires")}
+        self._save_cached_token(username, info)
+        return info
+
+    def _save_cached_token(self, username: str, info: dict):
+        try:
+            expires = float(info.get("expires"))
+        except (TypeError, ValueError):
+            return
+        try:
+            _write_private_file(_token_cache_path(self.base_url, username),
+                                json.dumps({"token": info["token"], "role": info.get("role"), "expires": expires,
+                                            "username": username.lower()}))
+        except OSError:
+            pass
+
+    async def resume_session(self, username: str):
+        """Reuse a cached, unexpired token for username; returns login info or None."""
+        try:
+            path = _token_cache_path(self.base_url, username)
+            cached = json.loads(_read_private_file(path))
+            if float(cached.get("expires", 0)) <= time.time() + 30 or not cached.get("token"):
+                raise ValueError("expired")
+        except (OSError, ValueError, TypeError, AttributeError):
+            return None
+        await self._set_token(username, cached["token"])
+        try:
+            # list_users is the only read-only admin endpoint, so it doubles as the token probe
+            # (it fetches the whole user table); a revoked token fails here, not on the first command
+            await self.list_users()
+        except APIError as e:
+            await self._set_token(username, None)
+            # only an auth rejection proves the token dead; network errors and 5xx keep it for next time
+            if e.status in (401, 403):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            return None
+        return {"token": cached["token"], "role": cached.get("role"), "expires": cached["expires"]}
 
     # existing admin ops
     async def ban_user(self, target: str):
@@ -133,6 +297,13 @@ class HTTPXAdminClient:
         payload = {"username": old_username, "new_username": new_username}
         return await self._request("/admin/change_user_username", "POST", json_payload=payload)
 
+    async def batch(self, ops: list[dict]):
+        # ops: [{"op": "ban", "username": "a"}, ...] -> one round trip for all of them
+        return await self._request("/admin/batch", "POST", json_payload={"ops": ops})
+
+# bulk file op name -> HTTPXAdminClient method used for the per-op fallback
+BULK_OPS = {"ban": "ban_user", "unban": "unban_user", "delete": "delete_user"}
+
 class CommandRegistry:
     def __init__(self):
         self._commands: dict[str, tuple[str, callable]] = {}
@@ -150,7 +321,10 @@ class AdminCLI:
     def __init__(self, client: HTTPXAdminClient):
         self.client = client
         self.registry = CommandRegistry()
+        # per-username locks so concurrent ops never mutate the same account at once
+        self._key_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._register_core_commands()
+        self._freeze_commands()
 
     def _register_core_commands(self):
         # base admin ops
@@ -161,8 +335,21 @@ class AdminCLI:
         self.registry.register("setpass", "Reset a user's password", self.cmd_setpass)
         self.registry.register("rename", "Rename a user", self.cmd_rename)
         self.registry.register("broadcast", "Broadcast message to all users", self.cmd_broadcast)
+        self.registry.register("bulk", "Run ban/unban/delete from a file", self.cmd_bulk)
         self.registry.register("exit", "Exit CLI", self.cmd_exit)
 
+    def _freeze_commands(self):
+        """Precompute the menu text and name->handler table; rerun after registering more commands."""
+        prefix, suffix = C.BLUE + "  ", C.END + "\n"
+        self._menu_cached = "".join(prefix + k.ljust(12) + " - " + desc + suffix
+                                    for k, (desc, _) in self.registry.all())
+        self._dispatch = {k: func for k, (_, func) in self.registry.all()}
+
+    def _print_resp(self, resp):
+        # server body is already JSON; print it as-is instead of decoding and re-encoding
+        raw = getattr(resp, "raw", b"")
+        prin(raw.decode("utf-8", "replace") if raw else pretty_json(resp), C.CYAN)
+
     async def run(self):
         await self._login_flow()
         try:
@@ -181,18 +368,17 @@ class AdminCLI:
                 parts = cmd.split()
                 name = parts[0]
                 args = parts[1:]
-                entry = self.registry.get(name)
-                if not entry:
+                func = self._dispatch.get(name)
+                if func is None:
                     prin("Unknown command, type 'help'", C.YELLOW)
                     continue
-                func = entry[1]
                 try:
                     await func(args)
                 except APIError as e:
                     prin(f"API error: {e}", C.RED)
                     if isinstance(e.detail, dict):
                         try:
-                            prin(json.dumps(e.detail, indent=2, ensure_ascii=False), C.RED)
+                            prin(pretty_json(e.detail), C.RED)
                         except Exception:
                             pass
                 except Exception as e:
@@ -210,6 +396,10 @@ class AdminCLI:
                 sys.exit(1)
             if not username:
                 prin("Cancelled", C.YELLOW); sys.exit(1)
+            info = await self.client.resume_session(username)
+            if info and info.get("role") == "admin":
+                prin(f"Logged in as {username} (cached session)", C.GREEN)
+                return
             pwd = getpass.getpass("Password: ")
             try:
                 info = await self.client.login(username, pwd)
@@ -223,17 +413,52 @@ class AdminCLI:
             prin(f"Logged in as {username}", C.GREEN)
             return
 
+    async def gather_ops(self, calls: list[tuple[str, Awaitable]], limit: int = 8):
+        """Run (username, coroutine) calls concurrently, at most `limit` in flight.
+
+        Calls sharing a username are serialized. Returns results in order, with
+        exceptions returned in place rather than raised.
+        """
+        sem = asyncio.Semaphore(limit)
+
+        async def run(key, coro):
+            async with self._key_locks[key], sem:
+                return await coro
+
+        return await asyncio.gather(*(run(k, c) for k, c in calls), return_exceptions=True)
+
+    async def _run_many(self, op: str, targets: list[str]):
+        """Confirm and run one BULK_OPS op against several users concurrently."""
+        if op in ("ban", "delete") and self.client.username in targets:
+            prin(f"Cannot {op} yourself", C.RED); return
+        names = ", ".join(targets)
+        if op == "delete":
+            # same warning as the single-user path; a bulk delete is no less permanent
+            prompt = f"*** PERMANENT DELETE {len(targets)} users ({names})? This cannot be undone. Confirm"
+        else:
+            prompt = f"Confirm {op} {len(targets)} users ({names})?"
+        if not confirm(prompt):
+            prin("Cancelled", C.YELLOW); return
+        method = getattr(self.client, BULK_OPS[op])
+        results = await self.gather_ops([(t, method(t)) for t in targets])
+        for t, res in zip(targets, results):
+            if isinstance(res, Exception):
+                prin(f"{op:8} {t:20} FAIL {res}", C.RED)
+            else:
+                prin(f"{op:8} {t:20} PASS", C.GREEN)
+
     def _print_header(self):
         prin("", C.END)
         prin(f"Admin: {self.client.username or 'NOT LOGGED IN'}", C.GREEN)
         prin("Commands:", C.CYAN)
-        for k, (desc, _) in self.registry._commands.items():
-            prin(f"  {k:12} - {desc}", C.BLUE)
+        self._write_commands()
 
     def _print_help(self):
         prin("Available commands:", C.CYAN)
-        for name, (desc, _) in self.registry._commands.items():
-            prin(f"  {name:12} - {desc}", C.BLUE)
+        self._write_commands()
+
+    def _write_commands(self):
+        sys.stdout.write(self._menu_cached)
 
     # ------------ new CLI commands ------------
     async def cmd_list(self, args: list[str]):
@@ -248,15 +473,17 @@ class AdminCLI:
             return
         # print table header
         prin(f"{'USERNAME':20} {'ROLE':8} {'CREATED (unix)'}", C.BOLD)
+        # build the whole table and write it once; thousands of rows make per-row print() add up
+        strftime, localtime = time.strftime, time.localtime
+        out = []
         for u in users:
-            username = u.get("username", "")
-            role = u.get("role", "")
             created = u.get("created", 0)
             try:
-                created_h = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(int(created)))
+                created_h = strftime("%Y-%m-%d %H:%M:%S", localtime(int(created)))
             except Exception:
                 created_h = str(created)
-            prin(f"{username:20} {role:8} {created_h}", C.CYAN)
+            out.append(color(f"{u.get('username', ''):20} {u.get('role', ''):8} {created_h}", C.CYAN) + "\n")
+        sys.stdout.write("".join(out))
 
     async def cmd_setpass(self, args: list[str]):
         """Reset a user's password (admin)."""
@@ -275,7 +502,7 @@ class AdminCLI:
             prin("Cancelled", C.YELLOW); return
         resp = await self.client.change_user_password(target, new_pw)
         prin(f"Password reset for {target}", C.GREEN)
-        prin(json.dumps(resp, indent=2, ensure_ascii=False), C.CYAN)
+        self._print_resp(resp)
 
     async def cmd_rename(self, args: list[str]):
         """Rename a user (admin)."""
@@ -292,10 +519,12 @@ class AdminCLI:
             prin("Cancelled", C.YELLOW); return
         resp = await self.client.change_user_username(old, new)
         prin(f"Renamed {old} -> {new}", C.GREEN)
-        prin(json.dumps(resp, indent=2, ensure_ascii=False), C.CYAN)
+        self._print_resp(resp)
 
     # ------------ existing commands (improved with safer prints) ------------
     async def cmd_ban(self, args: list[str]):
+        if len(args) > 1:
+            return await self._run_many("ban", [a.lower() for a in args])
         if not args:
             target = input(color("Username to ban: ", C.BLUE)).strip().lower()
         else:
@@ -308,9 +537,11 @@ class AdminCLI:
             prin("Cancelled", C.YELLOW); return
         resp = await self.client.ban_user(target)
         prin(f"Banned {target}", C.GREEN)
-        prin(json.dumps(resp, indent=2, ensure_ascii=False), C.CYAN)
+        self._print_resp(resp)
 
     async def cmd_unban(self, args: list[str]):
+        if len(args) > 1:
+            return await self._run_many("unban", [a.lower() for a in args])
         if not args:
             target = input(color("Username to unban: ", C.BLUE)).strip().lower()
         else:
@@ -321,9 +552,11 @@ class AdminCLI:
             prin("Cancelled", C.YELLOW); return
         resp = await self.client.unban_user(target)
         prin(f"Unbanned {target}", C.GREEN)
-        prin(json.dumps(resp, indent=2, ensure_ascii=False), C.CYAN)
+        self._print_resp(resp)
 
     async def cmd_delete(self, args: list[str]):
+        if len(args) > 1:
+            return await self._run_many("delete", [a.lower() for a in args])
         if not args:
             target = input(color("Username to delete: ", C.RED)).strip().lower()
         else:
@@ -336,7 +569,7 @@ class AdminCLI:
             prin("Cancelled", C.YELLOW); return
         resp = await self.client.delete_user(target)
         prin(f"Deleted {target}", C.GREEN)
-        prin(json.dumps(resp, indent=2, ensure_ascii=False), C.CYAN)
+        self._print_resp(resp)
 
     async def cmd_broadcast(self, args: list[str]):
         subj = ""
@@ -347,27 +580,67 @@ class AdminCLI:
         if not subj:
             prin("Missing subject", C.YELLOW); return
         prin("Enter message. End with a single '.' on a line.", C.YELLOW)
-        lines = []
-        while True:
-            try:
-                ln = input()
-            except KeyboardInterrupt:
-                print(); break
-            if ln == ".":
-                break
-            lines.append(ln)
-        msg = "\n".join(lines).strip()
+        # main thread, so Ctrl-C ends the message (read_until_dot) instead of the CLI
+        msg = read_until_dot().strip()
         if not msg:
             prin("Empty message", C.YELLOW); return
         prin("Preview:", C.CYAN)
         prin(f"Subject: {subj}", C.BLUE)
-        for line in textwrap.wrap(msg, width=78):
+        for line in _WRAPPER.wrap(msg):
             prin(line, C.CYAN)
         if not confirm("Send broadcast to ALL users?"):
             prin("Cancelled", C.YELLOW); return
         resp = await self.client.broadcast(subj, msg)
         prin("Broadcast sent", C.GREEN)
-        prin(json.dumps(resp, indent=2, ensure_ascii=False), C.CYAN)
+        self._print_resp(resp)
+
+    async def cmd_bulk(self, args: list[str]):
+        """Run many ban/unban/delete ops from a file of 'op username' lines."""
+        if not args:
+            path = input(color("File with 'op username' lines: ", C.BLUE)).strip()
+        else:
+            path = args[0]
+        if not path:
+            prin("No file provided", C.YELLOW); return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError as e:
+            prin(f"Cannot read {path}: {e}", C.RED); return
+        ops = []
+        for n, ln in enumerate(lines, 1):
+            ln = ln.strip()
+            if not ln or ln.startswith("#"):
+                continue
+            parts = ln.split()
+            if len(parts) != 2 or parts[0] not in BULK_OPS:
+                prin(f"Line {n}: expected '<{'|'.join(BULK_OPS)}> <username>', got {ln!r}", C.RED); return
+            op, target = parts[0], parts[1].lower()
+            if op in ("ban", "delete") and target == self.client.username:
+                prin(f"Line {n}: cannot {op} yourself", C.RED); return
+            ops.append({"op": op, "username": target})
+        if not ops:
+            prin("No operations found", C.YELLOW); return
+        if not confirm(f"Run {len(ops)} operations?"):
+            prin("Cancelled", C.YELLOW); return
+        try:
+            resp = await self.client.batch(ops)
+            results = resp.get("results") if isinstance(resp, dict) else resp
+        except APIError as e:
+            if e.status != 404:
+                raise
+            # server without /admin/batch: fall back to one request per op
+            done = await self.gather_ops(
+                [(op["username"], getattr(self.client, BULK_OPS[op["op"]])(op["username"])) for op in ops])
+            results = [{"ok": False, "error": str(r)} if isinstance(r, Exception) else {"ok": True} for r in done]
+        results = results or []
+        prin(f"{'OP':8} {'USERNAME':20} {'RESULT'}", C.BOLD)
+        for op, res in zip(ops, results):
+            ok = isinstance(res, dict) and res.get("ok", False)
+            detail = "" if ok else f" {res.get('error', '') if isinstance(res, dict) else res}"
+            prin(f"{op['op']:8} {op['username']:20} {'PASS' if ok else 'FAIL'}{detail}", C.GREEN if ok else C.RED)
+        if len(results) < len(ops):
+            prin(f"Server returned {len(results)} results for {len(ops)} ops", C.YELLOW)
 
     async def cmd_exit(self, args: list[str]):
         prin("Bye", C.GREEN)
@@ -376,12 +649,15 @@ class AdminCLI:
 
 async def main_async(argv):
     p = argparse.ArgumentParser()
-    p.add_argument("--server", "-s", default="http://omx.dedyn.io:30174")
+    p.add_argument("--server", "-s", default="http://omx.dedyn.io:30174",
+                   help="server URL; HTTP/2 is used only for https:// and when h2 is installed")
     p.add_argument("--timeout", "-t", type=int, default=8)
     p.add_argument("--retries", "-r", type=int, default=4)
     p.add_argument("--backoff", "-b", type=float, default=0.4)
+    p.add_argument("--max-delay", type=float, default=30.0)
     args = p.parse_args(argv[1:])
-    client = HTTPXAdminClient(base_url=args.server, timeout=args.timeout, retries=args.retries, backoff=args.backoff)
+    client = HTTPXAdminClient(base_url=args.server, timeout=args.timeout, retries=args.retries, backoff=args.backoff,
+                              max_delay=args.max_delay)
     cli = AdminCLI(client)
     try:
         await cli.run()
@@ -390,8 +666,24 @@ async def main_async(argv):
     finally:
         await client.close()
 
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
 def main():
-    asyncio.run(main_async(sys.argv))
+    # with any handler other than the default one installed, asyncio.run() keeps it instead of
+    # switching to "cancel the main task", so Ctrl-C still interrupts the prompt that is waiting
+    signal.signal(signal.SIGINT, _raise_interrupt)
+    run = asyncio.run
+    if sys.platform != "win32":
+        try:
+            # uvloop.run builds its loop through asyncio.Runner's loop_factory
+            from uvloop import run
+        except ImportError:
+            pass
+    try:
+        run(main_async(sys.argv))
+    except KeyboardInterrupt:
+        prin("\nInterrupted", C.YELLOW)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,22 +1,17 @@
 #!/usr/bin/env python3
 # OMX Mail Client
 
+# httpx, prompt_toolkit, textwrap and getpass are imported where first used,
+# so reaching the menu doesn't pay for ssl/h11/anyio and the editor stack
 import os
+import atexit
+import functools
 import json
-import getpass
 import time
-import textwrap
 import sys
 import re
-import httpx
-import colorama
-import socket
-from colorama import Fore, Style as CStyle
-from prompt_toolkit import Application
-from prompt_toolkit.layout import Layout, HSplit
-from prompt_toolkit.widgets import TextArea
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.styles import Style as PTStyle
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -33,21 +28,54 @@ DEFAULT_SERVER = f"http://{DEFAULT_SERVER_HOST}:{DEFAULT_SERVER_PORT}"
 TIMEOUT = 6 
 PAGE_SIZE = 12
 
-# init Colorama
-colorama.init(autoreset=True)
+# one keep-alive connection pool for the whole session, created on first use
+HTTP = None
+
+def _http():
+    global HTTP
+    if HTTP is None:
+        import httpx
+        HTTP = httpx.Client(
+            base_url=DEFAULT_SERVER,
+            timeout=TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            headers={"User-Agent": f"omx/{CLIENT_VERSION}"},
+        )
+        atexit.register(HTTP.close)
+    return HTTP
+
+# shared wrapper for search snippets, built once instead of per textwrap.wrap() call
+_WRAPPER = None
+
+def wrap_text(text):
+    global _WRAPPER
+    if _WRAPPER is None:
+        import textwrap
+        _WRAPPER = textwrap.TextWrapper(width=78)
+    return _WRAPPER.wrap(text)
 
 class C:
-    HEADER = Fore.MAGENTA
-    BLUE   = Fore.BLUE
-    CYAN   = Fore.CYAN
-    GREEN  = Fore.GREEN
-    YELLOW = Fore.YELLOW
-    RED    = Fore.RED
-    END    = CStyle.RESET_ALL
-    BOLD   = CStyle.BRIGHT
+    HEADER = "\033[35m"
+    BLUE   = "\033[34m"
+    CYAN   = "\033[36m"
+    GREEN  = "\033[32m"
+    YELLOW = "\033[33m"
+    RED    = "\033[31m"
+    END    = "\033[0m"
+    BOLD   = "\033[1m"
+
+_TTY = sys.stdout.isatty()
+if not _TTY:
+    # piped/redirected output gets plain text
+    for _name in ("HEADER", "BLUE", "CYAN", "GREEN", "YELLOW", "RED", "END", "BOLD"):
+        setattr(C, _name, "")
+elif os.name == "nt":
+    # Windows consoles need colorama to translate ANSI; POSIX terminals handle it natively
+    import colorama
+    colorama.init(autoreset=True)
 
 def color(msg, col=C.END):
-    return f"{col}{msg}{C.END}"
+    return col + msg + C.END
 
 def printc(msg, col=C.END):
     print(color(msg, col))
@@ -61,21 +89,33 @@ def pause(msg="Press enter to continue..."):
 # ---------- config management ----------
 CONFIG = {}
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+    _loads = json.loads
+
 def load_config():
     global CONFIG
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, "r") as f:
-                CONFIG = json.load(f)
+            with open(CONFIG_FILE, "rb") as f:
+                CONFIG = _loads(f.read())
         except Exception:
             CONFIG = {}
     else:
         CONFIG = {}
 
 def save_config():
+    tmp = CONFIG_FILE + ".tmp"
     try:
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(CONFIG, f)
+        # write aside and swap in, so Ctrl-C mid-write can't leave a truncated config
+        with open(tmp, "wb") as f:
+            f.write(_dumps(CONFIG))
+        os.replace(tmp, CONFIG_FILE)
     except Exception as e:
         printc(f"Failed to save config: {e}", C.RED)
 
@@ -83,17 +123,30 @@ load_config()
 SERVER_URL = CONFIG.get("server_url", DEFAULT_SERVER)
 
 # ---------- utilities ----------
+_SPLIT_RE = re.compile(r"[,\s]+")
+_RANGE_RE = re.compile(r"^(\d+)(?:-(\d+))?$")
+
 def parse_recipient_field(s: str):
     if not s:
         return []
-    parts = []
-    if "," in s:
-        parts = [p.strip() for p in s.split(",")]
-    else:
-        parts = [p.strip() for p in s.split()]
-    parts = [p for p in parts if p]
-    return parts
+    return [p for p in _SPLIT_RE.split(s.strip()) if p]
     
+def parse_selection(s: str, count: int):
+    """Turn '1,3,5-7' into sorted 0-based indexes; None if any part is invalid or out of range."""
+    picked = set()
+    for tok in _SPLIT_RE.split(s.strip()):
+        if not tok:
+            continue
+        m = _RANGE_RE.match(tok)
+        if not m:
+            return None
+        lo = int(m.group(1))
+        hi = int(m.group(2) or lo)
+        if lo < 1 or hi > count or lo > hi:
+            return None
+        picked.update(range(lo - 1, hi))
+    return sorted(picked)
+
 def ensure_logged_in():
     if CONFIG.get("token") and CONFIG.get("username"):
         return True
@@ -107,15 +160,27 @@ def require_login_flow():
     user_login()
     return ensure_logged_in()
 
+# pages are re-rendered often and neighbouring mails share timestamps; key on int seconds
+@functools.lru_cache(maxsize=512)
+def _fmt_ts_short(ts):
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+
+@functools.lru_cache(maxsize=512)
+def _fmt_ts_long(ts):
+    return time.ctime(ts)
+
 def pretty_mail_list(mails, start_index=1):
     mapping = {}
+    lines = []
     for i, m in enumerate(mails, start_index):
         subj = m.get("subject") or "(no subject)"
         sender = m.get("from") or m.get("sender") or "(unknown)"
         ts = m.get("timestamp") or 0
-        date = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
-        printc(f"[{i}] {subj} | From: {sender} | {date}", C.CYAN)
+        date = _fmt_ts_short(int(ts))
+        lines.append(f"{C.CYAN}[{i}] {subj} | From: {sender} | {date}{C.END}\n")
         mapping[i] = m
+    # one write per page instead of one print per mail
+    sys.stdout.write("".join(lines))
     return mapping
 
 def show_mail_detail(mail):
@@ -144,10 +209,16 @@ def show_mail_detail(mail):
     print(body)
 
     ts = mail.get("timestamp") or 0
-    printc(f"{C.BOLD}Timestamp:{C.END} {time.ctime(ts)}", C.BLUE)
+    printc(f"{C.BOLD}Timestamp:{C.END} {_fmt_ts_long(int(ts))}", C.BLUE)
     printc("-" * 60, C.CYAN)
     
 def multiline_input_scrollable(existing_lines=None):
+    from prompt_toolkit import Application
+    from prompt_toolkit.layout import Layout, HSplit
+    from prompt_toolkit.widgets import TextArea
+    from prompt_toolkit.key_binding import KeyBindings
+    from prompt_toolkit.styles import Style as PTStyle
+
     if existing_lines is None:
         text = ""
     else:
@@ -182,8 +253,58 @@ def multiline_input_scrollable(existing_lines=None):
     clear_screen()
     return new_lines
     
+# ---------- Saved password ----------
+# kept in the OS keyring when available; client_config.json is only the fallback
+KEYRING_SERVICE = "omx"
+
+def _keyring():
+    try:
+        import keyring
+        return keyring
+    except ImportError:
+        return None
+
+def store_password(username, password):
+    kr = _keyring()
+    if kr is not None:
+        try:
+            kr.set_password(KEYRING_SERVICE, username, password)
+            CONFIG.pop("password", None)
+            return
+        except Exception:
+            pass
+    CONFIG["password"] = password
+
+def get_saved_password(username):
+    kr = _keyring()
+    if kr is not None and username:
+        try:
+            pw = kr.get_password(KEYRING_SERVICE, username)
+            if pw:
+                return pw
+        except Exception:
+            pass
+    return CONFIG.get("password")
+
+def forget_password(username):
+    kr = _keyring()
+    if kr is not None and username:
+        try:
+            kr.delete_password(KEYRING_SERVICE, username)
+        except Exception:
+            pass
+    CONFIG.pop("password", None)
+
+def ask_current_password(prompt):
+    import getpass
+    saved = get_saved_password(CONFIG.get("username"))
+    if saved:
+        return getpass.getpass(f"{prompt} (Enter to use saved): ") or saved
+    return getpass.getpass(f"{prompt}: ")
+
 # ---------- Auth flows ----------
 def user_register():
+    import getpass
     clear_screen()
     printc("=== REGISTER ===", C.HEADER)
     while True:
@@ -204,9 +325,10 @@ def user_register():
         time.sleep(0.3)
         ok2, resp2 = send_request("/login", {"username": username, "password": password})
         if ok2 and resp2.get("token"):
+            _invalidate_mail_caches()
             CONFIG["username"] = username
             CONFIG["token"] = resp2.get("token")
-            CONFIG["password"] = password
+            store_password(username, password)
             save_config()
             printc("Auto-logged in and token saved.", C.GREEN)
             pause()
@@ -217,6 +339,7 @@ def user_register():
             return
 
 def user_login():
+    import getpass
     clear_screen()
     printc("=== LOGIN ===", C.HEADER)
     username = input("Username: ").strip()
@@ -232,49 +355,87 @@ def user_login():
     if not token:
         printc("Login did not return token — server issue.", C.RED)
         pause(); return
+    # pages cached or prefetched for the previous account must never be shown to this one
+    _invalidate_mail_caches()
     CONFIG["username"] = username
     CONFIG["token"] = token
     if input("Save password locally for account actions? (y/n): ").strip().lower() == "y":
-        CONFIG["password"] = password
+        store_password(username, password)
     else:
-        CONFIG.pop("password", None)
+        forget_password(username)
     save_config()
     printc("Logged in — token saved.", C.GREEN)
     pause()
 
 def user_logout():
+    _invalidate_mail_caches()
+    forget_password(CONFIG.get("username"))
     CONFIG.pop("token", None)
     CONFIG.pop("username", None)
-    CONFIG.pop("password", None)
     save_config()
     printc("Logged out locally.", C.GREEN)
     pause()
 
 # ---------- Mail operations ----------
 def send_request(endpoint, payload):
+    ok, resp, _ = _post(endpoint, payload)
+    return ok, resp
+
+def _post(endpoint, payload):
+    """send_request, plus the HTTP status of the reply (None if none arrived)."""
+    import httpx
+    status = None
     try:
         token = CONFIG.get("token")
-        headers = {"Authorization": f"Bearer {token}"} if token else {}
-        with httpx.Client(timeout=TIMEOUT) as client:
-            r = client.post(f"http://{DEFAULT_SERVER_HOST}:{DEFAULT_SERVER_PORT}{endpoint}",
-                            json=payload, headers=headers)
-            r.raise_for_status()
-            resp = r.json()
-            if resp.get("ok"):
-                return True, resp
-            else:
-                err_msg = resp.get("error") or "Unknown server error"
-                return False, {"error": err_msg}
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        r = _http().post(endpoint, json=payload, headers=headers)
+        status = r.status_code
+        r.raise_for_status()
+        resp = r.json()
+        if resp.get("ok"):
+            if endpoint in _MUTATING_ENDPOINTS:
+                _invalidate_mail_caches()
+            return True, resp, status
+        else:
+            err_msg = resp.get("error") or "Unknown server error"
+            return False, {"error": err_msg}, status
     except httpx.TimeoutException:
-        return False, {"error": "Request timed out."}
+        return False, {"error": "Request timed out."}, None
     except httpx.RequestError as e:
-        return False, {"error": f"Connection error: {str(e)}"}
+        return False, {"error": f"Connection error: {str(e)}"}, None
     except ValueError:
         # JSON decode error
-        return False, {"error": "Invalid response from server."}
+        return False, {"error": "Invalid response from server."}, status
     except Exception as e:
-        return False, {"error": f"Unexpected error: {str(e)}"}
+        return False, {"error": f"Unexpected error: {str(e)}"}, status
             
+def send_many(endpoint, item_key, items, **extra):
+    """
+    Send several items to an endpoint that takes one `item_key` per call.
+    Tries a single request with a list under `item_key + "s"` first and falls back
+    to one request per item if the server rejects it. Returns [(item, error)] for failures.
+    """
+    if len(items) > 1:
+        ok, resp, status = _post(endpoint, {item_key + "s": items, **extra})
+        if ok:
+            return []
+        # only a server that answered "no" to the list form gets per-item calls; after a
+        # timeout or 5xx the batch may have been applied, so resending would double up
+        if status not in (200, 400, 404, 405, 422):
+            return [(item, resp) for item in items]
+    failed = []
+    for item in items:
+        ok, resp = send_request(endpoint, {item_key: item, **extra})
+        if not ok:
+            failed.append((item, resp))
+    return failed
+
+def bulk_delete(ids, folder):
+    return send_many("/delete_mail", "mail_id", ids, folder=folder)
+
+def bulk_add_spam(senders):
+    return send_many("/add_sender_to_spam", "sender", senders)
+
 def action_send():
     if not require_login_flow():
         return
@@ -346,10 +507,118 @@ def action_send():
 
     pause()
     
+# background fetch of the next page while the user reads the current one;
+# (username, folder, page) -> (submit time, future)
+_PREFETCH = ThreadPoolExecutor(max_workers=2)
+_PREFETCHED = {}
+
+# short-lived on-disk copy of fetched pages so re-opening a folder page skips the server
+_CACHE_DIR = os.path.join(CONFIG_DIR, "mail_cache")
+PAGE_CACHE_TTL = 30.0
+_CACHE_COMPRESS_MIN = 16 * 1024
+
+# endpoints that change folder contents; a successful call drops every cached page
+_MUTATING_ENDPOINTS = {"/send", "/delete_mail", "/recover_mail", "/add_sender_to_spam", "/delete_sender_from_spam"}
+
+def _page_cache_path(folder, page):
+    user = re.sub(r"\W", "_", CONFIG.get("username") or "")
+    return os.path.join(_CACHE_DIR, f"{user}_{folder}_{page}.json")
+
+def _read_page_cache(folder, page):
+    path = _page_cache_path(folder, page)
+    try:
+        if time.time() - os.stat(path).st_mtime > PAGE_CACHE_TTL:
+            return None
+        with open(path, "rb") as f:
+            raw = f.read()
+        # large pages are stored zlib-compressed; plain JSON always starts with "{"
+        if raw[:1] != b"{":
+            raw = zlib.decompress(raw)
+        return _loads(raw)
+    except Exception:
+        return None
+
+def _write_page_cache(folder, page, resp, fetched_at=None):
+    """Cache a page; fetched_at (epoch secs) backdates the entry so its TTL runs from the fetch."""
+    path = _page_cache_path(folder, page)
+    tmp = path + ".tmp"
+    try:
+        # pages hold mail bodies: keep them private to this user
+        os.makedirs(_CACHE_DIR, mode=0o700, exist_ok=True)
+        if os.name != "nt" and os.stat(_CACHE_DIR).st_mode & 0o077:
+            os.chmod(_CACHE_DIR, 0o700)
+        raw = _dumps(resp)
+        if len(raw) >= _CACHE_COMPRESS_MIN:
+            raw = zlib.compress(raw, 1)
+        if os.path.lexists(tmp):
+            os.unlink(tmp)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_NOFOLLOW", 0), 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+        if fetched_at is not None:
+            os.utime(tmp, (fetched_at, fetched_at))
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+def _invalidate_page_cache():
+    try:
+        with os.scandir(_CACHE_DIR) as it:
+            for e in it:
+                try:
+                    os.unlink(e.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+def _invalidate_mail_caches():
+    _invalidate_prefetch()
+    _invalidate_page_cache()
+
+def _page_payload(folder, page):
+    return {"folder": folder, "limit": PAGE_SIZE, "offset": page * PAGE_SIZE}
+
+def _prefetch_page(folder, page):
+    key = (CONFIG.get("username"), folder, page)
+    # a fresh on-disk copy already makes that page instant
+    if key not in _PREFETCHED and _read_page_cache(folder, page) is None:
+        _PREFETCHED[key] = (time.time(), _PREFETCH.submit(send_request, "/fetch_mail", _page_payload(folder, page)))
+
+def _take_prefetched(folder, page):
+    """Return a finished-or-running prefetch for this user's page, or None if absent or stale."""
+    entry = _PREFETCHED.pop((CONFIG.get("username"), folder, page), None)
+    if entry is None:
+        return None
+    submitted, fut = entry
+    if fut.cancelled() or time.time() - submitted > PAGE_CACHE_TTL:
+        fut.cancel()
+        return None
+    return entry
+
+def _invalidate_prefetch():
+    for _, fut in _PREFETCHED.values():
+        fut.cancel()
+    _PREFETCHED.clear()
+
 def list_folder(folder, page=0):
     if not require_login_flow(): return []
-    payload = {"folder": folder, "limit": PAGE_SIZE, "offset": page * PAGE_SIZE}
-    ok, resp = send_request("/fetch_mail", payload)
+    prefetched = _take_prefetched(folder, page)
+    resp = None
+    if prefetched is not None:
+        ok, resp = prefetched[1].result()
+        if ok:
+            _write_page_cache(folder, page, resp, fetched_at=prefetched[0])
+        else:
+            # a failed background fetch is retried in the foreground below
+            resp = None
+    else:
+        resp = _read_page_cache(folder, page)
+        ok = resp is not None
+    if resp is None:
+        ok, resp = send_request("/fetch_mail", _page_payload(folder, page))
+        if ok:
+            _write_page_cache(folder, page, resp)
     if not ok:
         printc(f"Failed to fetch {folder}: {resp}", C.RED)
         return []
@@ -358,6 +627,8 @@ def list_folder(folder, page=0):
         printc("No mails.", C.YELLOW)
         return []
     pretty_mail_list(mails)
+    if len(mails) >= PAGE_SIZE:
+        _prefetch_page(folder, page + 1)
     return mails
 
 def interactive_read(folder):
@@ -374,11 +645,34 @@ def interactive_read(folder):
             if choice == "b":
                 return
             else:
+                _invalidate_mail_caches()
                 continue
 
-        printc("\nOptions: [n]ext page, [p]rev page, [o]pen <num>, [r]efresh, [b]ack", C.BLUE)
+        printc("\nOptions: [n]ext page, [p]rev page, [o]pen <num>, [d]elete <nums>, [s]pam <nums>, [r]efresh, [b]ack", C.BLUE)
         cmd = input("Choice: ").strip().lower()
 
+        if cmd.startswith("d ") or cmd.startswith("s "):
+            sel = parse_selection(cmd[2:], len(mails))
+            if not sel:
+                printc("Invalid selection (e.g. 1,3,5-7)", C.RED)
+                pause()
+                continue
+            chosen = [mails[i] for i in sel]
+            if cmd[0] == "d":
+                if input(f"Delete {len(chosen)} mail(s)? (y/n): ").strip().lower() != "y":
+                    continue
+                failed = bulk_delete([m.get("id") for m in chosen], folder)
+                done = "Moved to deleted." if folder != "deleted" else "Permanently deleted."
+            else:
+                senders = list(dict.fromkeys(m.get("from") for m in chosen if m.get("from")))
+                failed = bulk_add_spam(senders)
+                done = "Senders added to your spam list."
+            for item, resp in failed:
+                printc(f"Failed for {item}: {resp}", C.RED)
+            if not failed:
+                printc(done, C.GREEN)
+            pause()
+            continue
         if cmd == "n":
             page += 1
             continue
@@ -449,6 +743,7 @@ def interactive_read(folder):
             break
 
         elif cmd == "r":
+            _invalidate_mail_caches()
             continue
         elif cmd == "b":
             return
@@ -497,24 +792,27 @@ def action_search():
     if not results:
         printc("No results.", C.YELLOW); pause(); return
 
+    out = []
     for i, r in enumerate(results, 1):
         subj = r.get("subject") or "(no subject)"
         sender = r.get("from") or r.get("sender") or "(unknown)"
         ts = r.get("timestamp") or 0
-        printc(f"[{i}] {subj} | From: {sender} | {time.ctime(ts)}", C.CYAN)
+        out.append(f"{C.CYAN}[{i}] {subj} | From: {sender} | {_fmt_ts_long(int(ts))}{C.END}\n")
         snippet = r.get("snippet")
         if snippet:
-            for line in textwrap.wrap(snippet, width=78):
-                print(line)
-            print()
+            for line in wrap_text(snippet):
+                out.append(line + "\n")
+            out.append("\n")
+    sys.stdout.write("".join(out))
     pause()
 
 # ---------- Account management ----------
 def action_change_password():
+    import getpass
     if not require_login_flow(): return
     clear_screen()
     printc("=== CHANGE PASSWORD ===", C.HEADER)
-    old = getpass.getpass("Old password: ")
+    old = ask_current_password("Old password")
     new = getpass.getpass("New password: ")
     new2 = getpass.getpass("Repeat new: ")
     if new != new2:
@@ -523,8 +821,9 @@ def action_change_password():
     if not ok:
         printc(f"Change password failed: {resp}", C.RED)
     else:
-        if CONFIG.get("password"):
-            CONFIG["password"] = new
+        user = CONFIG.get("username")
+        if get_saved_password(user):
+            store_password(user, new)
             save_config()
         printc("Password changed.", C.GREEN)
     pause()
@@ -536,13 +835,17 @@ def action_change_username():
     new_user = input("New username: ").strip()
     if not new_user:
         printc("Cancelled.", C.YELLOW); return
-    pw = getpass.getpass("Current password (required): ")
+    pw = ask_current_password("Current password (required)")
     ok, resp = send_request("/change_username", {"new_username": new_user, "password": pw})
     if not ok:
         printc(f"Change username failed: {resp}", C.RED)
     else:
         old = CONFIG.get("username")
+        saved = get_saved_password(old)
+        forget_password(old)
         CONFIG["username"] = new_user
+        if saved:
+            store_password(new_user, saved)
         save_config()
         printc(f"Username changed {old} -> {new_user}", C.GREEN)
     pause()
@@ -554,13 +857,19 @@ def action_delete_account():
     confirm = input("Type DELETE to permanently delete your account: ").strip()
     if confirm != "DELETE":
         printc("Cancelled.", C.YELLOW); return
+    import getpass
+    # never the saved password here: deleting the account must be re-authenticated by hand
     pw = getpass.getpass("Your password (required): ")
+    if not pw:
+        printc("Cancelled.", C.YELLOW); return
     ok, resp = send_request("/delete_account", {"password": pw})
     if not ok:
         printc(f"Delete account failed: {resp}", C.RED)
     else:
         printc("Account deleted on server. Removing local config.", C.GREEN)
-        CONFIG.pop("username", None); CONFIG.pop("token", None); CONFIG.pop("password", None)
+        _invalidate_mail_caches()
+        forget_password(CONFIG.get("username"))
+        CONFIG.pop("username", None); CONFIG.pop("token", None)
         save_config()
         pause()
         # exit client
@@ -605,30 +914,43 @@ def action_remove_spam_sender():
     pause()
 
 def clear_screen():
-    os.system("cls" if os.name == "nt" else "clear")
+    # ANSI home + clear screen + clear scrollback; colorama translates it on Windows
+    if _TTY:
+        sys.stdout.write("\033[H\033[2J\033[3J")
+        sys.stdout.flush()
     
+# monotonic time of the last successful probe; menu redraws within HEALTH_TTL skip the network
+_LAST_OK = [0.0]
+HEALTH_TTL = 5.0
+
 def check_server():
+    if time.monotonic() - _LAST_OK[0] < HEALTH_TTL:
+        return True
+    import httpx
     printc("Loading...", C.BLUE)
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.settimeout(TIMEOUT)
     try:
-        s.connect((DEFAULT_SERVER_HOST, DEFAULT_SERVER_PORT))
-        s.close()
+        # any HTTP response means the server is up; this also warms the keep-alive pool
+        _http().get("/")
+        _LAST_OK[0] = time.monotonic()
         return True
-    except Exception:
+    except httpx.RequestError:
         printc("Error connecting to server. Aborting...", C.RED)
         time.sleep(1)
         sys.exit(1)
 
 # ---------- Main menu ----------
+_BANNER = (
+    f"{C.BOLD}{C.BLUE}╔══════════════════════════════════╗{C.END}\n"
+    f"{C.BOLD}{C.BLUE}║        OMX Mail Client           ║{C.END}\n"
+    f"{C.BOLD}{C.BLUE}╚══════════════════════════════════╝{C.END}\n"
+)
+
 def main_menu():
     while True:
         check_server()
         clear_screen()
         user = CONFIG.get("username")
-        print(f"{C.BOLD}{C.BLUE}╔══════════════════════════════════╗{C.END}")
-        print(f"{C.BOLD}{C.BLUE}║        OMX Mail Client           ║{C.END}")
-        print(f"{C.BOLD}{C.BLUE}╚══════════════════════════════════╝{C.END}")
+        sys.stdout.write(_BANNER)
         if user:
             printc(f"Logged in as: {user}", C.GREEN)
         else:
@@ -2,7 +2,7 @@
 # OMX Launcher - advanced, robust, secure
 # Features:
 # - safe update of requirements/app/main with backups + rollback
-# - skip downloads/installs when local packages already present
+# - skip downloads/installs when local packages match requirements.txt
 # - verify downloads with optional .sha256 files if available
 # - non-destructive pip install to local target
 # - resilient to network issues, EOFError, KeyboardInterrupt
@@ -11,19 +11,31 @@
 
 from __future__ import annotations
 import os
+import re
 import sys
 import subprocess
 import time
-import glob
 import shutil
 import threading
+import urllib.error
 import urllib.request
 import hashlib
+import json
 import tempfile
 import argparse
+import importlib
 import importlib.util
+import py_compile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from typing import Optional
 
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
 # -------- console colors --------
 BLUE = "\033[34m"
 CYAN = "\033[96m"
@@ -39,6 +51,8 @@ DOWNLOAD_DIR = os.path.join(BASE_DIR, "downloaded_packages")
 LOCAL_DIR = os.path.join(BASE_DIR, "local_packages")
 UPDATE_DIR = os.path.join(BASE_DIR, "update")
 REQ_FILE = os.path.join(BASE_DIR, "requirements.txt")
+REQ_HASH_FILE = os.path.join(LOCAL_DIR, ".req.hash")
+UPDATE_STAMP = os.path.join(BASE_DIR, ".last_update_check")
 
 APP_URL = "https://raw.githubusercontent.com/optimum-modern-exchange/omx/refs/heads/main/app.py"
 MAIN_URL = "https://raw.githubusercontent.com/optimum-modern-exchange/omx/refs/heads/main/main.py"
@@ -48,12 +62,18 @@ LOG_PATH = os.path.join(BASE_DIR, "launcher_update.log")
 TIMEOUT = 8  # seconds for network ops
 LOADER_JOIN_TIMEOUT = 2.0
 
+_ANSI_RE = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
+_HEX64_RE = re.compile(r'([a-fA-F0-9]{64})')
+
 # -------- runtime flags (set by CLI) --------
 FLAGS = {
     "silent": False,
     "no_update": False,
     "force_update": False,
-    "verbose": False
+    "verbose": False,
+    "no_verify": False,
+    "update_interval": 6 * 3600,
+    "deep_verify": False
 }
 
 # -------- utils --------
@@ -80,7 +100,12 @@ def safe_print(*args, **kwargs):
 
 def clear_screen():
     try:
-        os.system("cls" if os.name == "nt" else "clear")
+        if os.name == "nt":
+            # the launcher runs before colorama is available, so keep cls on Windows
+            os.system("cls")
+        else:
+            sys.stdout.write("\033[H\033[2J\033[3J")
+            sys.stdout.flush()
     except Exception:
         pass
 
@@ -96,100 +121,330 @@ def center_text(text: str, width: int) -> str:
 
 def strip_ansi(s: str) -> str:
     # minimal ANSI stripper for width calculations
-    import re
-    return re.sub(r'\x1B\[[0-?]*[ -/]*[@-~]', '', s)
+    return _ANSI_RE.sub('', s)
+
+class TermCtx:
+    """Terminal geometry for one launcher run; measured once and shared by both phases."""
+    __slots__ = ("w", "h", "title_y", "loading_y")
+
+    def __init__(self):
+        self.w, self.h = get_terminal_size()
+        self.title_y = self.h // 2
+        self.loading_y = self.title_y + 1
+
+    def show_title(self, text: str) -> None:
+        # cursor move and centered title in a single write
+        safe_print(f"\033[{self.title_y};1H" + center_text(text, self.w), end="", flush=True)
+
+_TERM: Optional[TermCtx] = None
 
-def move_cursor(row: int, col: int = 1):
+def term_ctx() -> TermCtx:
+    global _TERM
+    if _TERM is None:
+        _TERM = TermCtx()
+    return _TERM
+
+# -------- http --------
+USER_AGENT = "OMX-Launcher/1.0"
+# every request goes to github; a pool keeps the TLS connection alive between them
+_HTTP = urllib3.PoolManager(maxsize=4, headers={"User-Agent": USER_AGENT}, retries=False) if urllib3 else None
+
+@contextmanager
+def http_open(url: str, method: str = "GET", timeout: float = TIMEOUT, headers: Optional[dict] = None):
+    """Yield a response with .status, .headers and .read(n); HTTP error statuses are returned, not raised."""
+    if _HTTP is not None:
+        resp = _HTTP.request(method, url, headers={"User-Agent": USER_AGENT, **(headers or {})},
+                             preload_content=False, redirect=True,
+                             timeout=urllib3.Timeout(connect=timeout, read=timeout))
+        try:
+            yield resp
+        finally:
+            resp.drain_conn()
+            resp.release_conn()
+        return
+    req = urllib.request.Request(url, method=method, headers={"User-Agent": USER_AGENT, **(headers or {})})
     try:
-        print(f"\033[{row};{col}H", end="", flush=True)
-    except Exception:
-        pass
+        resp = urllib.request.urlopen(req, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        resp = e
+    with resp:
+        yield resp
 
 # -------- network check (robust) --------
+INTERNET_TTL = 30.0  # seconds a connectivity probe result is reused
+_INTERNET_CACHE = {"ts": 0.0, "val": None}
+_INTERNET_LOCK = threading.Lock()
+
 def check_internet(timeout: int = TIMEOUT) -> bool:
     """Try to open a short HEAD to github - more reliable than raw socket."""
+    # update and install phases both ask; one probe per TTL is enough
+    with _INTERNET_LOCK:
+        if _INTERNET_CACHE["val"] is not None and time.monotonic() - _INTERNET_CACHE["ts"] < INTERNET_TTL:
+            return _INTERNET_CACHE["val"]
     try:
-        req = urllib.request.Request("https://github.com", method="HEAD", headers={"User-Agent": "OMX-Launcher/1.0"})
-        with urllib.request.urlopen(req, timeout=timeout):
-            return True
+        with http_open("https://github.com", method="HEAD", timeout=timeout) as resp:
+            result = resp.status < 400
     except Exception as e:
         log(f"check_internet failed: {e}")
-        return False
+        result = False
+    with _INTERNET_LOCK:
+        _INTERNET_CACHE.update(ts=time.monotonic(), val=result)
+    return result
 
 # -------- animated loader thread --------
-def animated_loading(stop_event: threading.Event, term_width: int, loading_y: int, term_height: int, msg: str = "Loading"):
+# one daemon thread serves both launcher phases; each phase only swaps the text it draws
+_LOADER = {"thread": None, "stop": threading.Event(), "prefix": None}
+_LOADER_LOCK = threading.Lock()
+
+def loader_enabled() -> bool:
+    try:
+        return not FLAGS.get("silent") and sys.stdout.isatty()
+    except Exception:
+        return False
+
+def animated_loading(stop_event: threading.Event):
     dots = 0
+    suffix = RESET + "\033[K"
     try:
         while not stop_event.is_set():
-            text = f"{BLUE}{msg}{'.' * (dots % 4)}{RESET}"
-            move_cursor(loading_y, 1)
-            try:
-                print(center_text(text, term_width), end="", flush=True)
-            except Exception:
-                pass
+            # drawing under the lock lets pause_loader() guarantee the line is no longer touched
+            with _LOADER_LOCK:
+                prefix = _LOADER["prefix"]
+                if prefix is not None:
+                    try:
+                        sys.stdout.write(prefix + "." * (dots & 3) + suffix)
+                        sys.stdout.flush()
+                    except Exception:
+                        pass
             time.sleep(0.35)
             dots += 1
-        move_cursor(term_height, 1)
     except Exception as e:
         log(f"animated_loading exception: {e}")
 
+def start_loader(term: TermCtx, msg: str = "Loading") -> None:
+    if not loader_enabled():
+        return
+    # only the trailing dots change per tick, so cursor move + padding + message are fixed;
+    # msg is plain text, so its visible width is len(msg) plus at most 3 dots
+    pad = " " * max(0, (term.w // 2) - ((len(msg) + 3) // 2))
+    with _LOADER_LOCK:
+        _LOADER["prefix"] = f"\033[{term.loading_y};1H{pad}{BLUE}{msg}"
+        if _LOADER["thread"] is None:
+            t = threading.Thread(target=animated_loading, args=(_LOADER["stop"],), daemon=True)
+            _LOADER["thread"] = t
+            t.start()
+
+def pause_loader() -> None:
+    with _LOADER_LOCK:
+        _LOADER["prefix"] = None
+
+def stop_loader() -> None:
+    pause_loader()
+    t = _LOADER["thread"]
+    if t is not None:
+        _LOADER["stop"].set()
+        t.join(timeout=LOADER_JOIN_TIMEOUT)
+        _LOADER["thread"] = None
+        _LOADER["stop"] = threading.Event()
+
 # -------- file utils --------
+SHA_CACHE_MAX = 64
+_SHA_CACHE: OrderedDict[tuple, str] = OrderedDict()
+_SHA_LOCK = threading.Lock()
+
 def file_sha256(path: str) -> Optional[str]:
     try:
-        h = hashlib.sha256()
+        # keyed by stat so a rewritten file is simply a new entry
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        with _SHA_LOCK:
+            cached = _SHA_CACHE.get(key)
+            if cached is not None:
+                _SHA_CACHE.move_to_end(key)
+                return cached
         with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        return h.hexdigest()
+            if hasattr(hashlib, "file_digest"):
+                # 3.11+: C-level read loop, no per-chunk bytecode
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            else:
+                h = hashlib.sha256()
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+                digest = h.hexdigest()
+        _remember_sha(key, digest)
+        return digest
     except Exception as e:
         log(f"file_sha256 error {path} {e}")
         return None
 
+def _remember_sha(key: tuple, digest: str) -> None:
+    with _SHA_LOCK:
+        _SHA_CACHE[key] = digest
+        if len(_SHA_CACHE) > SHA_CACHE_MAX:
+            _SHA_CACHE.popitem(last=False)
+
+def _read_json_file(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+def _write_json_file(path: str, data: dict) -> None:
+    try:
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except Exception as e:
+        log(f"write {path} error {e}")
+
+ETAGS_FILE = os.path.join(BASE_DIR, ".http_etags.json")
+_ETAGS: Optional[dict] = None
+_ETAG_LOCK = threading.Lock()
+
+def _load_etags() -> dict:
+    global _ETAGS
+    if _ETAGS is None:
+        _ETAGS = _read_json_file(ETAGS_FILE)
+    return _ETAGS
+
+def _conditional_headers(url: str, dest: str) -> dict:
+    """If-None-Match/If-Modified-Since for url, but only while dest still holds what that validator served."""
+    with _ETAG_LOCK:
+        entry = _load_etags().get(url)
+    if not entry or not os.path.exists(dest):
+        return {}
+    if not FLAGS.get("no_verify") and entry.get("sha256") != file_sha256(dest):
+        return {}
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+def _record_etag(url: str, resp, sha256: Optional[str]) -> None:
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    with _ETAG_LOCK:
+        etags = _load_etags()
+        if not (etag or last_modified):
+            if etags.pop(url, None) is not None:
+                _write_json_file(ETAGS_FILE, etags)
+            return
+        etags[url] = {"etag": etag, "last_modified": last_modified, "sha256": sha256}
+        _write_json_file(ETAGS_FILE, etags)
+
 def download_url_to_file(url: str, dest: str, timeout: int = TIMEOUT) -> bool:
     """
-    Download to tmp file, verify if identical then replace atomically.
+    Stream to tmp file, verify if identical then replace atomically.
+    Sends the stored ETag/Last-Modified so an unchanged file comes back as an empty 304.
     Returns True on success (or if identical), False on error.
     """
+    tmp_path = None
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "OMX-Launcher/1.0"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            if getattr(resp, "status", 200) != 200:
-                log(f"download failed {url} status {getattr(resp, 'status', 'unknown')}")
+        with http_open(url, timeout=timeout, headers=_conditional_headers(url, dest)) as resp:
+            if resp.status == 304:
+                log(f"not modified, keeping {dest}")
+                return True
+            if resp.status != 200:
+                log(f"download failed {url} status {resp.status}")
                 return False
-            data = resp.read()
-    except Exception as e:
-        log(f"download error {url} {e}")
-        return False
+            # hash while writing so the new file never has to be read back
+            verify = not FLAGS.get("no_verify")
+            h = hashlib.sha256()
+            tmp_fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dest))
+            with os.fdopen(tmp_fd, "wb") as f:
+                while True:
+                    chunk = resp.read(65536)
+                    if not chunk:
+                        break
+                    if verify:
+                        h.update(chunk)
+                    f.write(chunk)
+            _record_etag(url, resp, h.hexdigest() if verify else None)
+        if not verify:
+            os.replace(tmp_path, dest)
+            log(f"downloaded {url} -> {dest} (unverified)")
+            return True
+        tmp_hash = h.hexdigest()
 
-    try:
         # if dest exists and identical, skip replace
-        if os.path.exists(dest):
-            existing_hash = file_sha256(dest)
-            tmp_hash = hashlib.sha256(data).hexdigest()
-            if existing_hash and tmp_hash == existing_hash:
-                log(f"download identical, skipping replace {url}")
-                return True
-        tmp_fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dest))
-        with os.fdopen(tmp_fd, "wb") as f:
-            f.write(data)
+        if os.path.exists(dest) and file_sha256(dest) == tmp_hash:
+            log(f"download identical, skipping replace {url}")
+            os.remove(tmp_path)
+            return True
         os.replace(tmp_path, dest)
+        st = os.stat(dest)
+        _remember_sha((os.path.abspath(dest), st.st_mtime_ns, st.st_size), tmp_hash)
         log(f"downloaded {url} -> {dest}")
         return True
     except Exception as e:
-        log(f"download write error {url} -> {dest} {e}")
+        log(f"download error {url} -> {dest} {e}")
         # try remove tmp if exists
         try:
-            if 'tmp_path' in locals() and os.path.exists(tmp_path):
+            if tmp_path and os.path.exists(tmp_path):
                 os.remove(tmp_path)
         except Exception:
             pass
         return False
 
+VERIFY_CACHE_FILE = os.path.join(BASE_DIR, ".verify_cache.json")
+VERIFY_TTL = 24 * 3600  # seconds a passed check stays trusted for an unchanged file
+_VERIFY_CACHE: Optional[dict] = None
+_VERIFY_LOCK = threading.Lock()
+
+def _load_verify_cache() -> dict:
+    global _VERIFY_CACHE
+    if _VERIFY_CACHE is None:
+        _VERIFY_CACHE = _read_json_file(VERIFY_CACHE_FILE)
+    return _VERIFY_CACHE
+
+def _save_verify_cache() -> None:
+    _write_json_file(VERIFY_CACHE_FILE, _VERIFY_CACHE)
+
 def try_download_optional_hash(url: str, dest: str) -> bool:
     """
     If remote .sha256 exists next to url, download and verify dest.
     Returns True if either no remote hash or hash matches; False if hash present and doesn't match.
+    Real hash matches are remembered across runs while dest keeps the same mtime, size and sha256.
     """
+    path = os.path.abspath(dest)
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is not None:
+        with _VERIFY_LOCK:
+            entry = _load_verify_cache().get(path)
+        if (entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size
+                and url in entry.get("verified_against_url", ())
+                and time.time() - entry.get("verified_ts", 0) < VERIFY_TTL
+                and entry.get("sha256") == file_sha256(path)):
+            log(f"hash check cached for {dest}")
+            return True
+
+    result = _verify_remote_hash(url, dest)
+    # only a remote hash that actually matched is worth remembering; "no remote sha" is re-checked
+    if result and st is not None:
+        with _VERIFY_LOCK:
+            cache = _load_verify_cache()
+            entry = cache.get(path)
+            urls = entry.get("verified_against_url", []) if entry and entry.get("mtime_ns") == st.st_mtime_ns else []
+            cache[path] = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "sha256": file_sha256(path),
+                "verified_against_url": sorted(set(urls) | {url}),
+                "verified_ts": time.time(),
+            }
+            _save_verify_cache()
+    return result is not False
+
+def _verify_remote_hash(url: str, dest: str) -> Optional[bool]:
+    """True if a remote sha256 matched dest, False if it didn't, None if no remote sha was found."""
     # construct sha url heuristically: url + ".sha256" or replace extension
     tried = []
     base_sha1 = url + ".sha256"
@@ -197,14 +452,12 @@ def try_download_optional_hash(url: str, dest: str) -> bool:
     for sha_url in (base_sha1, base_sha2):
         tried.append(sha_url)
         try:
-            req = urllib.request.Request(sha_url, headers={"User-Agent": "OMX-Launcher/1.0"})
-            with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
-                if getattr(resp, "status", 200) != 200:
+            with http_open(sha_url) as resp:
+                if resp.status != 200:
                     continue
                 txt = resp.read().decode("utf-8", errors="ignore").strip()
                 # extract first hex-looking token
-                import re
-                m = re.search(r'([a-fA-F0-9]{64})', txt)
+                m = _HEX64_RE.search(txt)
                 if not m:
                     continue
                 remote_hash = m.group(1).lower()
@@ -223,9 +476,9 @@ def try_download_optional_hash(url: str, dest: str) -> bool:
                     return False
         except Exception:
             continue
-    # no remote sha found, treat as okay (warn)
+    # no remote sha found; the caller treats this as okay (warn)
     log(f"no remote sha found for {url} (tried: {tried})")
-    return True
+    return None
 
 # -------- local packages check --------
 def local_packages_ready() -> bool:
@@ -233,75 +486,170 @@ def local_packages_ready() -> bool:
     try:
         if not os.path.isdir(LOCAL_DIR):
             return False
-        # require at least one .dist-info or top-level package folder
-        for f in os.listdir(LOCAL_DIR):
-            if f.endswith(".dist-info") or f.endswith(".egg-info"):
-                return True
-            # top-level package folder or .py file
-            if os.path.isdir(os.path.join(LOCAL_DIR, f)) or f.endswith(".py"):
-                return True
+        # require at least one .dist-info, top-level package folder or .py file
+        with os.scandir(LOCAL_DIR) as it:
+            for e in it:
+                if e.name.endswith((".dist-info", ".egg-info", ".py")):
+                    return True
+                if e.is_dir(follow_symlinks=False):
+                    return True
         return False
     except Exception as e:
         log(f"local_packages_ready error {e}")
         return False
 
+def requirements_hash() -> Optional[str]:
+    try:
+        with open(REQ_FILE, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except Exception as e:
+        log(f"requirements_hash error {e}")
+        return None
+
+def local_packages_current() -> bool:
+    """Return True if LOCAL_DIR is populated and was installed from the current requirements.txt."""
+    if not local_packages_ready():
+        return False
+    current = requirements_hash()
+    if current is None:
+        return False
+    try:
+        with open(REQ_HASH_FILE, "r", encoding="utf-8") as f:
+            return f.read().strip() == current
+    except Exception:
+        return False
+
+def write_requirements_hash() -> None:
+    current = requirements_hash()
+    if current is None:
+        return
+    try:
+        with open(REQ_HASH_FILE, "w", encoding="utf-8") as f:
+            f.write(current)
+    except Exception as e:
+        log(f"write_requirements_hash error {e}")
+
 # -------- pip download & install --------
+UV = shutil.which("uv")
+
+def pip_install_cmd(files: list[str], use_uv: bool = True) -> list[str]:
+    """pip install argv for files into LOCAL_DIR; uses uv's installer when it is on PATH and use_uv."""
+    if UV and use_uv:
+        # uv has no `pip download`, but installs into a --target much faster than pip
+        return [UV, "pip", "install", *files, "--python", sys.executable,
+                "--target", LOCAL_DIR, "--upgrade", "--no-deps", "-q"]
+    return [sys.executable, "-m", "pip", "install", *files,
+            "--target", LOCAL_DIR, "--upgrade", "--no-deps", "-q"]
+
 def download_packages(packages: list[str]) -> bool:
     os.makedirs(DOWNLOAD_DIR, exist_ok=True)
     if not packages:
         log("no packages requested")
         return True
 
-    # if local packages already present, skip downloads entirely
-    if local_packages_ready():
-        log("local packages already installed, skipping download")
+    # if local packages already match requirements.txt, skip downloads entirely
+    if local_packages_current():
+        log("local packages up to date, skipping download")
         return True
 
     if not check_internet():
         log("no internet, skipping package download")
         return False
 
-    for pkg in packages:
+    # start from an empty dir: wheels left from an older requirements.txt would sit next to the
+    # new versions, break the batched install and could win in the per-file fallback
+    shutil.rmtree(DOWNLOAD_DIR, ignore_errors=True)
+    os.makedirs(DOWNLOAD_DIR, exist_ok=True)
+
+    # one pip process resolves and fetches everything; per-package runs are only for diagnostics
+    try:
+        cmd = [sys.executable, "-m", "pip", "download", *packages, "-d", DOWNLOAD_DIR, "-q"]
+        log(f"running: {' '.join(cmd)}")
+        subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        log(f"downloaded packages {' '.join(packages)}")
+        return True
+    except subprocess.CalledProcessError as e:
+        log(f"pip download failed for batch {e}, retrying per package")
+
+    # per-package runs are independent pip processes, so run them side by side; each gets
+    # its own dir (shared deps would otherwise be written concurrently) and is moved over after
+    def fetch(pkg: str) -> bool:
+        tmp_dir = tempfile.mkdtemp(prefix=".pip-", dir=DOWNLOAD_DIR)
         try:
-            cmd = [sys.executable, "-m", "pip", "download", pkg, "-d", DOWNLOAD_DIR, "-q"]
+            cmd = [sys.executable, "-m", "pip", "download", pkg, "-d", tmp_dir, "-q"]
             log(f"running: {' '.join(cmd)}")
-            subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            rc = subprocess.call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if rc != 0:
+                log(f"pip download failed {pkg} exit {rc}")
+                return False
+            with os.scandir(tmp_dir) as it:
+                for e in it:
+                    # os.replace is atomic, so a dep fetched by two workers just lands twice
+                    os.replace(e.path, os.path.join(DOWNLOAD_DIR, e.name))
             log(f"downloaded package {pkg}")
-        except subprocess.CalledProcessError as e:
-            log(f"pip download failed {pkg} {e}")
+            return True
+        except OSError as e:
+            log(f"moving downloads for {pkg} failed {e}")
             return False
-    return True
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(packages))) as ex:
+        return all(list(ex.map(fetch, packages)))
 
 def install_from_download() -> bool:
-    # if already installed, skip
-    if local_packages_ready():
-        log("local packages already present, skipping install")
+    # if already installed from the current requirements, skip
+    if local_packages_current():
+        log("local packages up to date, skipping install")
         # ensure in sys.path
         if LOCAL_DIR not in sys.path:
             sys.path.insert(0, LOCAL_DIR)
         return True
 
     os.makedirs(LOCAL_DIR, exist_ok=True)
-    files = glob.glob(os.path.join(DOWNLOAD_DIR, "*"))
+    wheels, sdists = [], []
+    try:
+        with os.scandir(DOWNLOAD_DIR) as it:
+            for e in it:
+                # d_type answers this without a stat; symlinks in the download dir are not ours
+                if not e.is_file(follow_symlinks=False):
+                    continue
+                n = e.name
+                if n.endswith(".whl"):
+                    wheels.append(e.path)
+                elif n.endswith((".tar.gz", ".zip")):
+                    sdists.append(e.path)
+    except OSError as e:
+        log(f"cannot scan {DOWNLOAD_DIR} {e}")
+    files = wheels + sdists
     if not files:
         log("no downloaded files to install")
         return False
 
-    for file in files:
+    # uv first when present, then plain pip: an old uv or one that can't find the
+    # interpreter must not fail an install pip would have done
+    installed = False
+    for use_uv in ((True, False) if UV else (False,)):
         try:
-            cmd = [
-                sys.executable, "-m", "pip", "install", file,
-                "--target", LOCAL_DIR,
-                "--upgrade",
-                "--no-deps",
-                "-q"
-            ]
+            cmd = pip_install_cmd(files, use_uv)
             log(f"running: {' '.join(cmd)}")
             subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            log(f"installed {file} to {LOCAL_DIR}")
-        except subprocess.CalledProcessError as e:
-            log(f"pip install failed {file} {e}")
-            return False
+            log(f"installed {len(files)} files to {LOCAL_DIR}")
+            installed = True
+            break
+        except (subprocess.CalledProcessError, OSError) as e:
+            log(f"{'uv' if use_uv else 'pip'} install failed for batch {e}")
+    if not installed:
+        log("retrying install per file with pip")
+        for file in files:
+            try:
+                cmd = pip_install_cmd([file], use_uv=False)
+                log(f"running: {' '.join(cmd)}")
+                subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                log(f"installed {file} to {LOCAL_DIR}")
+            except subprocess.CalledProcessError as e:
+                log(f"pip install failed {file} {e}")
+                return False
 
     # add local packages to sys.path
     if LOCAL_DIR not in sys.path:
@@ -309,6 +657,12 @@ def install_from_download() -> bool:
     return True
 
 # -------- safe copy & backup helpers --------
+def files_identical(a: str, b: str) -> bool:
+    if not (os.path.exists(a) and os.path.exists(b)):
+        return False
+    ha = file_sha256(a)
+    return ha is not None and ha == file_sha256(b)
+
 def safe_copy(src: str, dst: str) -> bool:
     try:
         tmp = dst + ".tmp"
@@ -324,7 +678,14 @@ def backup_file(path: str) -> Optional[str]:
         if not os.path.exists(path):
             return None
         bak = path + ".bak"
-        shutil.copyfile(path, bak)
+        # updates land via os.replace (new inode), so a hardlink keeps the old content for free
+        try:
+            if os.path.lexists(bak):
+                os.remove(bak)
+            os.link(path, bak)
+        except OSError:
+            # cross-device or no hardlink support
+            shutil.copyfile(path, bak)
         log(f"backup created {bak}")
         return bak
     except Exception as e:
@@ -346,9 +707,19 @@ def restore_backup(path: str) -> bool:
 # -------- dynamic import test (does not pollute sys.modules) --------
 def test_import_module_from_path(path: str) -> bool:
     """
-    Try to import the module from given path in isolation. Returns True if import succeeded.
-    Does not add to sys.modules under 'app' name.
+    Check that the module at path is valid Python. Returns True if it compiles.
+    With --deep-verify it is also imported in isolation (not added to sys.modules under 'app').
     """
+    if not FLAGS.get("deep_verify"):
+        # syntax only: executing app.py would pull in its deps and run its top-level code
+        try:
+            with open(path, "rb") as f:
+                compile(f.read(), path, "exec")
+            log(f"syntax check OK for {path}")
+            return True
+        except (SyntaxError, ValueError, OSError) as e:
+            log(f"syntax check failed for {path}: {e}")
+            return False
     try:
         spec = importlib.util.spec_from_file_location("omx_update_test", path)
         if spec is None or spec.loader is None:
@@ -362,6 +733,21 @@ def test_import_module_from_path(path: str) -> bool:
         log(f"test import failed for {path}: {e}")
         return False
 
+def precompile_app() -> None:
+    """Write app.py bytecode ahead of the import if the cached .pyc is missing or stale."""
+    app_path = os.path.join(BASE_DIR, "app.py")
+    try:
+        if not os.path.exists(app_path):
+            return
+        sys.dont_write_bytecode = False
+        cached = importlib.util.cache_from_source(app_path)
+        if os.path.exists(cached) and os.stat(cached).st_mtime >= os.stat(app_path).st_mtime:
+            return
+        py_compile.compile(app_path, doraise=True)
+        log(f"precompiled {app_path}")
+    except Exception as e:
+        log(f"precompile_app error {e}")
+
 # -------- update logic with safety & rollback --------
 def update_files(force: bool = False) -> None:
     """
@@ -372,18 +758,22 @@ def update_files(force: bool = False) -> None:
         log("updates disabled by flag")
         return
 
+    # a recent successful check makes this whole phase a single stat()
+    if not force and not FLAGS.get("force_update"):
+        try:
+            age = time.time() - os.stat(UPDATE_STAMP).st_mtime
+            if age < FLAGS.get("update_interval", 0):
+                log(f"update check skipped, last one {int(age)}s ago")
+                return
+        except OSError:
+            pass
+
     os.makedirs(UPDATE_DIR, exist_ok=True)
     clear_screen()
-    term_width, term_height = get_terminal_size()
-    title_y = term_height // 2
-    loading_y = title_y + 1
-    move_cursor(title_y, 1)
-    safe_print(center_text(f"{CYAN}{BOLD}Checking for updates...{RESET}", term_width), end="", flush=True)
+    term = term_ctx()
+    term.show_title(f"{CYAN}{BOLD}Checking for updates...{RESET}")
 
-    stop_event = threading.Event()
-    loader_thread = threading.Thread(target=animated_loading, args=(stop_event, term_width, loading_y, term_height, "Updating"))
-    loader_thread.daemon = True
-    loader_thread.start()
+    start_loader(term, "Updating")
 
     req_path = os.path.join(UPDATE_DIR, "requirements.txt")
     app_path = os.path.join(UPDATE_DIR, "app.py")
@@ -400,12 +790,20 @@ def update_files(force: bool = False) -> None:
                 log("no local requirements.txt found; skipping updates")
                 return
 
-        # download requirements if internet
-        req_ok = False
+        # fetch requirements/app/main concurrently; each is an independent round trip
+        results = {"req": False, "app": False, "main": False}
         if internet:
-            req_ok = download_url_to_file(REQ_URL, req_path)
-            if not req_ok:
-                log("requirements download failed")
+            with ThreadPoolExecutor(max_workers=3) as ex:
+                futs = {ex.submit(download_url_to_file, url, path): name
+                        for url, path, name in ((REQ_URL, req_path, "req"),
+                                                (APP_URL, app_path, "app"),
+                                                (MAIN_URL, main_path, "main"))}
+                for f in as_completed(futs):
+                    results[futs[f]] = f.result()
+
+        req_ok = results["req"]
+        if internet and not req_ok:
+            log("requirements download failed")
         # if didn't download but local exists, use local
         if not req_ok and os.path.exists(REQ_FILE):
             log("using existing requirements.txt")
@@ -416,14 +814,9 @@ def update_files(force: bool = False) -> None:
             safe_copy(req_path, REQ_FILE)
             log("requirements updated/ensured")
 
-        # if no internet and no local packages we just return; packages handled later
-        # now attempt to download code files (only if internet)
-        app_ok = False
-        main_ok = False
-        if internet:
-            # download updated code to temporary update dir
-            app_ok = download_url_to_file(APP_URL, app_path)
-            main_ok = download_url_to_file(MAIN_URL, main_path)
+        # code files were downloaded to the temporary update dir above (only if internet)
+        app_ok = results["app"]
+        main_ok = results["main"]
 
         # decide whether to apply updates: only if downloads succeeded or force
         apply_app = app_ok or force or (not internet and os.path.exists(os.path.join(BASE_DIR, "app.py")))
@@ -438,32 +831,40 @@ def update_files(force: bool = False) -> None:
         # apply updates to working dir but test before finalizing
         applied_any = False
         try:
-            if apply_app and os.path.exists(app_path):
+            # unchanged files are left alone so their mtime (and cached .pyc) stay valid
+            if apply_app and os.path.exists(app_path) and not files_identical(app_path, app_orig):
                 safe_copy(app_path, app_orig)
                 applied_any = True
                 log("applied app.py update to working dir")
-            if apply_main and os.path.exists(main_path):
+            if apply_main and os.path.exists(main_path) and not files_identical(main_path, main_orig):
                 safe_copy(main_path, main_orig)
                 applied_any = True
                 log("applied main.py update to working dir")
 
-            # optional remote hash verification for safety
-            if internet and os.path.exists(app_orig):
-                ok_hash = try_download_optional_hash(APP_URL, app_orig)
-                if not ok_hash:
-                    raise RuntimeError("app.py hash verification failed")
-            if internet and os.path.exists(main_orig):
-                ok_hash = try_download_optional_hash(MAIN_URL, main_orig)
-                if not ok_hash:
-                    raise RuntimeError("main.py hash verification failed")
-
-            # test import of app.py to ensure it doesn't crash on import
+            # optional remote hash verification for safety, both files at once
+            if internet and not FLAGS.get("no_verify"):
+                checks = [(url, path, name) for url, path, name in ((APP_URL, app_orig, "app.py"),
+                                                                     (MAIN_URL, main_orig, "main.py"))
+                          if os.path.exists(path)]
+                with ThreadPoolExecutor(max_workers=2) as ex:
+                    verified = list(ex.map(lambda c: try_download_optional_hash(c[0], c[1]), checks))
+                for (_, _, name), ok_hash in zip(checks, verified):
+                    if not ok_hash:
+                        raise RuntimeError(f"{name} hash verification failed")
+
+            # check app.py compiles (or imports, with --deep-verify) before keeping it
             if os.path.exists(app_orig):
                 if not test_import_module_from_path(app_orig):
                     raise RuntimeError("import test failed for updated app.py")
 
             # if everything ok commit (backups already exist); remove backup files optionally
             log(f"update commit successful, app_ok={app_ok} main_ok={main_ok}")
+            # only a fully successful check (304s included) may postpone the next one
+            if internet and all(results.values()):
+                try:
+                    open(UPDATE_STAMP, "w").close()
+                except OSError as e:
+                    log(f"cannot write update stamp {e}")
         except Exception as e:
             log(f"update failed during apply/test: {e}")
             # attempt rollback
@@ -474,9 +875,7 @@ def update_files(force: bool = False) -> None:
             log("rolled back to backups after failed update")
             raise
     finally:
-        stop_event.set()
-        loader_thread.join(timeout=LOADER_JOIN_TIMEOUT)
-        time.sleep(0.15)
+        pause_loader()
         clear_screen()
 
 # -------- requirements reader --------
@@ -485,13 +884,9 @@ def read_requirements() -> list[str]:
         return []
     try:
         with open(REQ_FILE, "r", encoding="utf-8") as f:
-            lines = [l.strip() for l in f if l.strip() and not l.strip().startswith("#")]
-        pkgs: list[str] = []
-        for l in lines:
-            if l.startswith("-r ") or l.startswith("--requirement"):
-                continue
-            pkgs.append(l)
-        return pkgs
+            stripped = (l.strip() for l in f)
+            return [l for l in stripped
+                    if l and not l.startswith(("#", "-r ", "--requirement"))]
     except Exception as e:
         log(f"read_requirements error {e}")
         return []
@@ -499,64 +894,60 @@ def read_requirements() -> list[str]:
 # -------- startup intro & install flow --------
 def start_intro_and_install():
     clear_screen()
-    term_width, term_height = get_terminal_size()
-    title = f"{CYAN}{BOLD}OMX Mail Client Launcher{RESET}"
-    title_y = term_height // 2
-    loading_y = title_y + 1
-    move_cursor(title_y, 1)
-    safe_print(center_text(title, term_width), end="", flush=True)
+    term = term_ctx()
+    term.show_title(f"{CYAN}{BOLD}OMX Mail Client Launcher{RESET}")
 
-    stop_event = threading.Event()
-    loader_thread = threading.Thread(target=animated_loading, args=(stop_event, term_width, loading_y, term_height, "Preparing"))
-    loader_thread.daemon = True
-    loader_thread.start()
+    start_loader(term, "Preparing")
 
     try:
         pkgs = read_requirements()
-        if local_packages_ready():
-            log("local packages already installed, skipping download & install")
+        if local_packages_current():
+            log("local packages match requirements.txt, skipping download & install")
             if LOCAL_DIR not in sys.path:
                 sys.path.insert(0, LOCAL_DIR)
         elif pkgs:
             internet = check_internet()
-            if not internet:
+            if not internet and local_packages_ready():
+                # requirements changed since the last install but we can't fetch; keep what we have
+                log("no internet; using existing local packages from an older requirements.txt")
+                if LOCAL_DIR not in sys.path:
+                    sys.path.insert(0, LOCAL_DIR)
+            elif not internet:
                 # no internet & no local packages -> error
                 log("no internet and no local packages; cannot install requirements")
                 # leave loader running briefly to show message, then exit
-                stop_event.set()
-                loader_thread.join(timeout=LOADER_JOIN_TIMEOUT)
+                pause_loader()
                 clear_screen()
                 safe_print(f"{RED}Error: no internet and required packages not available locally.{RESET}")
                 raise SystemExit(1)
-            download_ok = download_packages(pkgs)
-            if download_ok:
-                install_ok = install_from_download()
-                if install_ok:
-                    if LOCAL_DIR not in sys.path:
-                        sys.path.insert(0, LOCAL_DIR)
-                    log("local packages installed and added to sys.path")
-                else:
-                    log("install_from_download failed, will attempt to continue using system packages")
-                    # try continue (not ideal)
             else:
-                log("download_packages failed")
-                # try continue if local packages present
-                if local_packages_ready():
-                    if LOCAL_DIR not in sys.path:
-                        sys.path.insert(0, LOCAL_DIR)
-                    log("using existing local packages despite download failure")
+                download_ok = download_packages(pkgs)
+                if download_ok:
+                    install_ok = install_from_download()
+                    if install_ok:
+                        write_requirements_hash()
+                        if LOCAL_DIR not in sys.path:
+                            sys.path.insert(0, LOCAL_DIR)
+                        log("local packages installed and added to sys.path")
+                    else:
+                        log("install_from_download failed, will attempt to continue using system packages")
+                        # try continue (not ideal)
                 else:
-                    stop_event.set()
-                    loader_thread.join(timeout=LOADER_JOIN_TIMEOUT)
-                    clear_screen()
-                    safe_print(f"{RED}Error: failed to download required packages and no local fallback.{RESET}")
-                    raise SystemExit(1)
+                    log("download_packages failed")
+                    # try continue if local packages present
+                    if local_packages_ready():
+                        if LOCAL_DIR not in sys.path:
+                            sys.path.insert(0, LOCAL_DIR)
+                        log("using existing local packages despite download failure")
+                    else:
+                        pause_loader()
+                        clear_screen()
+                        safe_print(f"{RED}Error: failed to download required packages and no local fallback.{RESET}")
+                        raise SystemExit(1)
         else:
             log("no requirements specified; skipping package install")
     finally:
-        stop_event.set()
-        loader_thread.join(timeout=LOADER_JOIN_TIMEOUT)
-        time.sleep(0.12)
+        pause_loader()
         clear_screen()
 
 # -------- main launcher entry --------
@@ -571,6 +962,7 @@ def run_launcher():
     except Exception as e:
         log(f"update_files raised: {e}")
         # continue, because we may still run with existing files
+    precompile_app()
 
     # install packages / prepare env
     try:
@@ -579,10 +971,11 @@ def run_launcher():
         raise
     except Exception as e:
         log(f"start_intro_and_install raised: {e}")
+    finally:
+        stop_loader()
 
     # import app safely and run it
     try:
-        import importlib
         if "app" in sys.modules:
             del sys.modules["app"]
         spec = importlib.util.find_spec("app")
@@ -640,6 +1033,10 @@ def parse_args():
     p.add_argument("--no-update", action="store_true", help="skip update check")
     p.add_argument("--force-update", action="store_true", help="force apply updates even if same")
     p.add_argument("--verbose", action="store_true", help="verbose logging to console")
+    p.add_argument("--no-verify", action="store_true", help="skip hash checks on downloads (trusted mirrors only)")
+    p.add_argument("--update-interval", type=int, default=FLAGS["update_interval"], metavar="SECS",
+                   help="seconds between update checks (0 checks every run)")
+    p.add_argument("--deep-verify", action="store_true", help="import updated app.py as a test instead of only compiling it")
     return p.parse_args()
 
 # -------- safe main wrapper --------
@@ -649,6 +1046,9 @@ def main():
     FLAGS["no_update"] = bool(args.no_update)
     FLAGS["force_update"] = bool(args.force_update)
     FLAGS["verbose"] = bool(args.verbose)
+    FLAGS["no_verify"] = bool(args.no_verify)
+    FLAGS["update_interval"] = max(0, args.update_interval)
+    FLAGS["deep_verify"] = bool(args.deep_verify)
 
     try:
         run_launcher()